@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
-import csv
-import json
+import asyncio
+import bisect
 import math
 import os
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Awaitable, Dict, Iterable, List, Optional, Tuple
 
-import requests
+import httpx
+import numpy as np
+import orjson
+import pandas as pd
 
 NDBC_REALTIME2_BASE = "https://www.ndbc.noaa.gov/data/realtime2"
 COOPS_DATAGETTER = "https://api.tidesandcurrents.noaa.gov/api/prod/datagetter"
@@ -19,20 +22,17 @@ OPEN_METEO = "https://api.open-meteo.com/v1/forecast"
 HISTORY_URL = "https://ew-sfex.github.io/sfex-surf-conditions/data/history_72h.json"
 
 APP_ID = "sfexaminer-surf-conditions"
+# Upper bound on station requests in flight at once during the fetch phase.
+MAX_CONCURRENT_FETCHES = 16
+
+# realtime2 columns used from the latest observation row.
+NDBC_COLUMNS = ("YY", "MM", "DD", "hh", "mm", "WVHT", "DPD", "MWD", "WSPD", "WDIR")
 
 
 def utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
-def clamp(x: float, lo: float, hi: float) -> float:
-    return max(lo, min(hi, x))
-
-
-def lerp(a: float, b: float, t: float) -> float:
-    return a + (b - a) * t
-
-
 def safe_float(v: str) -> Optional[float]:
     v = (v or "").strip()
     if v in ("", "MM"):
@@ -43,12 +43,9 @@ def safe_float(v: str) -> Optional[float]:
         return None
 
 
-def deg_diff(a: float, b: float) -> float:
-    """Smallest absolute difference between bearings in degrees."""
-    d = (a - b) % 360.0
-    if d > 180.0:
-        d -= 360.0
-    return abs(d)
+def deg_diff(a: Any, b: Any) -> Any:
+    """Smallest absolute difference between bearings in degrees (floats or NumPy arrays)."""
+    return abs(((a - b) + 180.0) % 360.0 - 180.0)
 
 
 def m_to_ft(m: float) -> float:
@@ -59,7 +56,7 @@ def ms_to_mph(ms: float) -> float:
     return ms * 2.2369362920544
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LocationRow:
     id: str
     name: str
@@ -73,35 +70,101 @@ class LocationRow:
     notes: str
 
 
+# Feature properties mirrored under props["metrics"].
+METRIC_KEYS = (
+    "waveHeightFt",
+    "dominantPeriodS",
+    "waveDirectionDeg",
+    "windSpeedMph",
+    "windDirectionDeg",
+    "tideHeightFt",
+    "tideTrend",
+)
+
+# (windSpeedMph, windDirectionDeg, source, observedAt) for one location.
+WindReading = Tuple[Optional[float], Optional[float], str, Optional[str]]
+
+
+LOCATION_STR_COLS = ("id", "name", "region", "primary_exposure", "tide_station", "ndbc_station", "notes")
+
+
 def read_locations_csv(path: str) -> List[LocationRow]:
-    out: List[LocationRow] = []
-    with open(path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for r in reader:
-            out.append(
-                LocationRow(
-                    id=r["id"].strip(),
-                    name=r["name"].strip(),
-                    region=(r.get("region") or "").strip(),
-                    lat=float(r["lat"]),
-                    lon=float(r["lon"]),
-                    primary_exposure=(r.get("primary_exposure") or "").strip(),
-                    offshore_wind_dir_deg=float(r.get("offshore_wind_dir_deg") or 0.0),
-                    tide_station=(r.get("tide_station") or "").strip(),
-                    ndbc_station=(r.get("ndbc_station") or "").strip(),
-                    notes=(r.get("notes") or "").strip(),
-                )
-            )
-    return out
+    df = pd.read_csv(
+        path,
+        encoding="utf-8",
+        dtype={c: str for c in LOCATION_STR_COLS},
+        converters={
+            "lat": float,
+            "lon": float,
+            "offshore_wind_dir_deg": lambda v: float(v or 0.0),
+        },
+        keep_default_na=False,
+    )
+    # Optional columns may be missing from hand-edited sheets.
+    for c in LOCATION_STR_COLS:
+        if c not in df:
+            df[c] = ""
+    if "offshore_wind_dir_deg" not in df:
+        df["offshore_wind_dir_deg"] = 0.0
+    str_cols = list(LOCATION_STR_COLS)
+    df[str_cols] = df[str_cols].apply(lambda col: col.str.strip())
+    return [LocationRow(*row) for row in df[[f.name for f in fields(LocationRow)]].itertuples(index=False, name=None)]
+
+
+def cache_last_modified(cache_path: str) -> Optional[str]:
+    """Last-Modified stored for a cached body, or None if either cache file is missing/unreadable."""
+    if not os.path.exists(f"{cache_path}.txt"):
+        return None
+    try:
+        with open(f"{cache_path}.meta", "rb") as f:
+            return orjson.loads(f.read())["last_modified"]
+    except Exception:
+        return None
+
+
+def read_cached_body(cache_path: str) -> str:
+    with open(f"{cache_path}.txt", "r", encoding="utf-8") as f:
+        return f.read()
+
 
+def write_text_cache(cache_path: str, body: str, last_modified: str) -> None:
+    with open(f"{cache_path}.txt", "w", encoding="utf-8") as f:
+        f.write(body)
+    with open(f"{cache_path}.meta", "wb") as f:
+        f.write(orjson.dumps({"last_modified": last_modified}))
 
-def fetch_text(url: str, timeout_s: int = 20) -> str:
-    resp = requests.get(url, timeout=timeout_s, headers={"User-Agent": APP_ID})
+
+async def fetch_text(client: httpx.AsyncClient, url: str, cache_path: Optional[str] = None) -> str:
+    """
+    GET a text body. With cache_path, the last body is kept at <cache_path>.txt and its
+    Last-Modified at <cache_path>.meta; the next request is conditional and a 304 reuses the body.
+    Cache file I/O runs in a worker thread so it doesn't block the other fetches.
+    """
+    if not cache_path:
+        resp = await client.get(url)
+        resp.raise_for_status()
+        return resp.text
+
+    last_modified = await asyncio.to_thread(cache_last_modified, cache_path)
+    headers = {"If-Modified-Since": last_modified} if last_modified else {}
+    resp = await client.get(url, headers=headers)
+    if resp.status_code == 304:
+        try:
+            return await asyncio.to_thread(read_cached_body, cache_path)
+        except (OSError, UnicodeDecodeError):
+            # Cached body vanished or is unreadable since the check; refetch unconditionally.
+            resp = await client.get(url)
     resp.raise_for_status()
+
+    last_modified = resp.headers.get("Last-Modified")
+    if last_modified:
+        await asyncio.to_thread(write_text_cache, cache_path, resp.text, last_modified)
     return resp.text
 
 
-def fetch_open_meteo_wind_current(locations: List[LocationRow]) -> Tuple[Dict[str, Dict[str, Any]], Optional[str]]:
+async def fetch_open_meteo_wind_current(
+    client: httpx.AsyncClient, locations: List[LocationRow]
+) -> Tuple[Dict[str, Dict[str, Any]], Optional[str]]:
     """
     Fetch per-location wind using Open-Meteo (no key). This helps avoid "every beach has identical wind"
     when many points share the same offshore buoy.
@@ -122,23 +185,19 @@ def fetch_open_meteo_wind_current(locations: List[LocationRow]) -> Tuple[Dict[st
         "timezone": "UTC",
     }
 
-    def do_request(timeout_s: int) -> Any:
-        resp = requests.get(
-            OPEN_METEO,
-            params=params,
-            timeout=timeout_s,
-            headers={"User-Agent": APP_ID},
-        )
+    async def do_request(timeout_s: int) -> Any:
+        # httpx timeouts apply per phase (connect/read/...); wait_for caps the whole attempt.
+        resp = await asyncio.wait_for(client.get(OPEN_METEO, params=params), timeout_s)
         resp.raise_for_status()
-        return resp.json()
+        return orjson.loads(resp.content)
 
     try:
-        # Best-effort retries with shorter timeouts.
+        # One attempt plus a single retry: at most ~25s for Open-Meteo in total.
         last_err: Optional[Exception] = None
         payload: Any = None
-        for timeout_s in (8, 12, 18):
+        for timeout_s in (10, 15):
             try:
-                payload = do_request(timeout_s)
+                payload = await do_request(timeout_s)
                 last_err = None
                 break
             except Exception as e:
@@ -205,54 +264,57 @@ def parse_ndbc_realtime2_station(txt: str) -> Dict[str, Any]:
 
     cols = header_line.split()
     vals = data_line.split()
-    if len(vals) < len(cols):
-        # Some feeds can have fewer trailing columns; pad with empty
-        vals = vals + [""] * (len(cols) - len(vals))
-
-    row = dict(zip(cols, vals))
-
-    yy = int(row["YY"])
-    mm = int(row["MM"])
-    dd = int(row["DD"])
-    hh = int(row["hh"])
-    minute = int(row.get("mm", "0"))
+    # Position of each column we read; trailing columns may be missing from the data line.
+    idx = {name: cols.index(name) for name in NDBC_COLUMNS if name in cols}
+
+    def col(name: str, default: str = "") -> str:
+        i = idx.get(name)
+        return vals[i] if i is not None and i < len(vals) else default
+
+    yy = int(col("YY"))
+    mm = int(col("MM"))
+    dd = int(col("DD"))
+    hh = int(col("hh"))
+    minute = int(col("mm", "0"))
     obs_time = datetime(yy, mm, dd, hh, minute, tzinfo=timezone.utc)
 
     return {
         "obs_time": obs_time,
-        "WVHT_m": safe_float(row.get("WVHT", "")),
-        "DPD_s": safe_float(row.get("DPD", "")),
-        "MWD_deg": safe_float(row.get("MWD", "")),
-        "WSPD_ms": safe_float(row.get("WSPD", "")),
-        "WDIR_deg": safe_float(row.get("WDIR", "")),
-        "raw": row,
+        "WVHT_m": safe_float(col("WVHT")),
+        "DPD_s": safe_float(col("DPD")),
+        "MWD_deg": safe_float(col("MWD")),
+        "WSPD_ms": safe_float(col("WSPD")),
+        "WDIR_deg": safe_float(col("WDIR")),
     }
 
 
-def fetch_ndbc_station_latest(station_id: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+async def fetch_ndbc_station_latest(
+    client: httpx.AsyncClient, station_id: str, cache_dir: Optional[str] = None
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
     if not station_id:
         return None, "no_station"
     url = f"{NDBC_REALTIME2_BASE}/{station_id}.txt"
+    cache_path = os.path.join(cache_dir, station_id) if cache_dir else None
     try:
-        txt = fetch_text(url)
+        txt = await fetch_text(client, url, cache_path)
         parsed = parse_ndbc_realtime2_station(txt)
         return parsed, None
     except Exception as e:
         return None, f"ndbc_error:{type(e).__name__}:{e}"
 
 
-def fetch_coops_predictions_series(
-    station_id: str, begin: datetime, end: datetime
+async def fetch_coops_predictions_series(
+    client: httpx.AsyncClient, station_id: str, begin: datetime, end: datetime
 ) -> Tuple[Optional[List[Tuple[datetime, float]]], Optional[str]]:
     """
     Fetch a tide prediction time series from CO-OPS.
-    We try a few intervals to be robust.
+    6-minute predictions first; hourly once if the station returns none. HTTP errors don't retry.
     Returns list of (time_utc, height_ft).
     """
     if not station_id:
         return None, "no_station"
 
-    def try_interval(interval: str) -> Optional[List[Tuple[datetime, float]]]:
+    async def try_interval(interval: str) -> Optional[List[Tuple[datetime, float]]]:
         params = {
             "product": "predictions",
             "application": APP_ID,
@@ -265,9 +327,9 @@ def fetch_coops_predictions_series(
             "interval": interval,
             "format": "json",
         }
-        resp = requests.get(COOPS_DATAGETTER, params=params, timeout=20, headers={"User-Agent": APP_ID})
+        resp = await client.get(COOPS_DATAGETTER, params=params)
         resp.raise_for_status()
-        payload = resp.json()
+        payload = orjson.loads(resp.content)
         preds = payload.get("predictions") or []
         out: List[Tuple[datetime, float]] = []
         for p in preds:
@@ -279,8 +341,8 @@ def fetch_coops_predictions_series(
         return out
 
     try:
-        for interval in ("6", "30", "60"):
-            series = try_interval(interval)
+        for interval in ("6", "60"):
+            series = await try_interval(interval)
             if series:
                 return series, None
         return None, "coops_no_predictions"
@@ -291,29 +353,22 @@ def fetch_coops_predictions_series(
 def tide_now_and_trend(series: List[Tuple[datetime, float]], now: datetime) -> Tuple[Optional[float], Optional[str]]:
     if not series:
         return None, None
-    # Find closest points around now
-    series_sorted = sorted(series, key=lambda x: x[0])
-    # Find index of last time <= now
-    idx = None
-    for i, (t, _) in enumerate(series_sorted):
-        if t <= now:
-            idx = i
-        else:
-            break
-    if idx is None:
+    # CO-OPS returns predictions in chronological order, so the series can be bisected as-is.
+    times = [t for t, _ in series]
+    # Index of last time <= now
+    idx = bisect.bisect_right(times, now) - 1
+    if idx < 0:
         # now is before first point
-        h = series_sorted[0][1]
+        h = series[0][1]
         return h, None
-    h0 = series_sorted[idx][1]
+    h0 = series[idx][1]
     # Trend: compare to a point ahead (~1 hour if possible)
-    look_ahead = now + timedelta(hours=1)
+    j = bisect.bisect_left(times, now + timedelta(hours=1))
     future = None
-    for t, h in series_sorted[idx:]:
-        if t >= look_ahead:
-            future = h
-            break
-    if future is None and idx + 1 < len(series_sorted):
-        future = series_sorted[idx + 1][1]
+    if j < len(series):
+        future = series[j][1]
+    elif idx + 1 < len(series):
+        future = series[idx + 1][1]
     trend = None
     if future is not None:
         if future > h0:
@@ -325,99 +380,142 @@ def tide_now_and_trend(series: List[Tuple[datetime, float]], now: datetime) -> T
     return h0, trend
 
 
-def wind_suitability_score(offshore_dir_deg: float, wind_dir_from_deg: Optional[float], wind_speed_mph: Optional[float]) -> float:
+def wind_suitability_score(
+    offshore_dir_deg: np.ndarray, wind_dir_from_deg: np.ndarray, wind_speed_mph: np.ndarray
+) -> np.ndarray:
     """
-    Returns 0..1 score where 1 is best (light offshore), 0 is worst (strong onshore).
-    wind_dir_from_deg: meteorological wind direction (FROM).
+    Returns 0..1 score per location where 1 is best (light offshore), 0 is worst (strong onshore).
+    wind_dir_from_deg: meteorological wind direction (FROM). NaN marks a missing reading.
     """
-    if wind_dir_from_deg is None or wind_speed_mph is None or offshore_dir_deg == 0:
-        return 0.5  # unknown => neutral
-
     angle = deg_diff(wind_dir_from_deg, offshore_dir_deg)
     # Direction factor: offshore within 45°, cross within 90°, onshore beyond 135°
-    if angle <= 45:
-        dir_factor = 1.0
-    elif angle <= 90:
-        dir_factor = lerp(1.0, 0.6, (angle - 45) / 45)
-    elif angle <= 135:
-        dir_factor = lerp(0.6, 0.2, (angle - 90) / 45)
-    else:
-        dir_factor = lerp(0.2, 0.0, (angle - 135) / 45)
+    # Ramps are lerp(a, b, t) = a + (b - a) * t written out, keeping lerp's float rounding.
+    dir_factor = np.select(
+        [angle <= 45, angle <= 90, angle <= 135],
+        [1.0, 1.0 + (0.6 - 1.0) * ((angle - 45) / 45), 0.6 + (0.2 - 0.6) * ((angle - 90) / 45)],
+        default=0.2 + (0.0 - 0.2) * ((angle - 135) / 45),
+    )
 
     # Speed factor: penalize above ~12 mph
     sp = wind_speed_mph
-    if sp <= 5:
-        speed_factor = 1.0
-    elif sp <= 12:
-        speed_factor = lerp(1.0, 0.6, (sp - 5) / 7)
-    elif sp <= 20:
-        speed_factor = lerp(0.6, 0.2, (sp - 12) / 8)
-    else:
-        speed_factor = 0.0
+    speed_factor = np.select(
+        [sp <= 5, sp <= 12, sp <= 20],
+        [1.0, 1.0 + (0.6 - 1.0) * ((sp - 5) / 7), 0.6 + (0.2 - 0.6) * ((sp - 12) / 8)],
+        default=0.0,
+    )
 
-    return clamp(dir_factor * speed_factor, 0.0, 1.0)
+    unknown = np.isnan(wind_dir_from_deg) | np.isnan(wind_speed_mph) | (offshore_dir_deg == 0)
+    return np.where(unknown, 0.5, np.clip(dir_factor * speed_factor, 0.0, 1.0))  # unknown => neutral
 
 
-def swell_score(wave_height_ft: Optional[float], period_s: Optional[float]) -> float:
+def swell_score(wave_height_ft: np.ndarray, period_s: np.ndarray) -> np.ndarray:
     """
-    0..50: combine size + period, clamped.
+    0..50 per location: combine size + period, clamped.
     """
-    if wave_height_ft is None and period_s is None:
-        return 0.0
-    h = wave_height_ft or 0.0
-    p = period_s or 0.0
+    h = np.nan_to_num(wave_height_ft)
+    p = np.nan_to_num(period_s)
     # Typical ranges: 0..15ft, 5..18s
-    h_norm = clamp(h / 12.0, 0.0, 1.0)  # 12ft ~ max for score scaling
-    p_norm = clamp((p - 6.0) / 10.0, 0.0, 1.0)
+    h_norm = np.clip(h / 12.0, 0.0, 1.0)  # 12ft ~ max for score scaling
+    p_norm = np.clip((p - 6.0) / 10.0, 0.0, 1.0)
     combined = 0.6 * h_norm + 0.4 * p_norm
-    return 50.0 * clamp(combined, 0.0, 1.0)
+    unknown = np.isnan(wave_height_ft) & np.isnan(period_s)
+    return np.where(unknown, 0.0, 50.0 * np.clip(combined, 0.0, 1.0))
 
 
-def tide_score(height_ft: Optional[float]) -> float:
+def tide_score(height_ft: np.ndarray) -> np.ndarray:
     """
-    0..20: default preference around mid tides (~2-5 ft MLLW, loosely).
+    0..20 per location: default preference around mid tides (~2-5 ft MLLW, loosely).
     """
-    if height_ft is None:
-        return 10.0  # unknown => neutral
     # Score highest around 3.5ft, lower when very low or very high
     center = 3.5
     spread = 3.0
-    z = abs(height_ft - center) / spread
-    return 20.0 * clamp(1.0 - z, 0.0, 1.0)
+    z = np.abs(height_ft - center) / spread
+    return np.where(np.isnan(height_ft), 10.0, 20.0 * np.clip(1.0 - z, 0.0, 1.0))  # unknown => neutral
 
 
-def build_feature(
-    loc: LocationRow,
-    now: datetime,
-    ndbc: Optional[Dict[str, Any]],
-    tide_height_ft: Optional[float],
-    tide_trend: Optional[str],
-) -> Dict[str, Any]:
-    wave_height_ft = None
-    period_s = None
-    wave_dir_deg = None
-    wind_speed_mph = None
-    wind_dir_deg = None
-    obs_time = None
+def as_column(values: Iterable[Optional[float]]) -> np.ndarray:
+    """Float column for the vectorized scorers; None becomes NaN."""
+    return np.array([np.nan if v is None else v for v in values], dtype=float)
+
+
+def score_locations(
+    offshore_dir_deg: np.ndarray,
+    wind_dir_deg: np.ndarray,
+    wind_speed_mph: np.ndarray,
+    wave_height_ft: np.ndarray,
+    period_s: np.ndarray,
+    tide_height_ft: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """
+    Score every location in one pass over parallel columns (one row per location).
+    """
+    swell = swell_score(wave_height_ft, period_s)
+    wind_suit = wind_suitability_score(offshore_dir_deg, wind_dir_deg, wind_speed_mph)
+    wind = 30.0 * wind_suit
+    tide = tide_score(tide_height_ft)
+    return {
+        "swell": swell,
+        "windSuitability": wind_suit,
+        "wind": wind,
+        "tide": tide,
+        # Quality sums the published (rounded) swell/tide components, so the popup's parts add up.
+        "quality": np.clip(np.round(swell, 1) + wind + np.round(tide, 1), 0.0, 100.0),
+    }
 
+
+def ndbc_readings(ndbc: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Latest NDBC observation in display units (ft, s, deg, mph). Missing values are None.
+    """
+    out: Dict[str, Any] = {
+        "waveHeightFt": None,
+        "dominantPeriodS": None,
+        "waveDirectionDeg": None,
+        "windSpeedMph": None,
+        "windDirectionDeg": None,
+        "observedAt": None,
+    }
     if ndbc:
-        obs_time = ndbc["obs_time"].isoformat()
+        out["observedAt"] = ndbc["obs_time"]
         if ndbc.get("WVHT_m") is not None:
-            wave_height_ft = m_to_ft(float(ndbc["WVHT_m"]))
+            out["waveHeightFt"] = m_to_ft(float(ndbc["WVHT_m"]))
         if ndbc.get("DPD_s") is not None:
-            period_s = float(ndbc["DPD_s"])
+            out["dominantPeriodS"] = float(ndbc["DPD_s"])
         if ndbc.get("MWD_deg") is not None:
-            wave_dir_deg = float(ndbc["MWD_deg"])
+            out["waveDirectionDeg"] = float(ndbc["MWD_deg"])
         if ndbc.get("WSPD_ms") is not None:
-            wind_speed_mph = ms_to_mph(float(ndbc["WSPD_ms"]))
+            out["windSpeedMph"] = ms_to_mph(float(ndbc["WSPD_ms"]))
         if ndbc.get("WDIR_deg") is not None:
-            wind_dir_deg = float(ndbc["WDIR_deg"])
+            out["windDirectionDeg"] = float(ndbc["WDIR_deg"])
+    return out
 
-    swell = swell_score(wave_height_ft, period_s)
-    wind_suit = wind_suitability_score(loc.offshore_wind_dir_deg, wind_dir_deg, wind_speed_mph)
-    wind = 30.0 * wind_suit
-    tide = tide_score(tide_height_ft)
-    quality = clamp(swell + wind + tide, 0.0, 100.0)
+
+def build_feature(
+    loc: LocationRow,
+    now: datetime,
+    readings: Dict[str, Any],
+    tide_height_ft: Optional[float],
+    tide_trend: Optional[str],
+    scores: Dict[str, float],
+    wind_override: Optional[WindReading] = None,
+) -> Dict[str, Any]:
+    wave_height_ft = readings["waveHeightFt"]
+    period_s = readings["dominantPeriodS"]
+    wave_dir_deg = readings["waveDirectionDeg"]
+    wind_speed_mph = readings["windSpeedMph"]
+    wind_dir_deg = readings["windDirectionDeg"]
+    wind_source = "ndbc"
+    wind_observed_at = None
+    obs_time = readings["observedAt"]
+
+    if wind_override:
+        wind_speed_mph, wind_dir_deg, wind_source, wind_observed_at = wind_override
+
+    swell = scores["swell"]
+    wind_suit = scores["windSuitability"]
+    wind = scores["wind"]
+    tide = scores["tide"]
+    quality = scores["quality"]
 
     props: Dict[str, Any] = {
         "id": loc.id,
@@ -439,30 +537,27 @@ def build_feature(
         "windDirectionDeg": None if wind_dir_deg is None else round(wind_dir_deg, 0),
         "tideHeightFt": None if tide_height_ft is None else round(tide_height_ft, 2),
         "tideTrend": tide_trend,
+        "windSource": wind_source,
         "components": {
             "swell": round(swell, 1),
             "wind": round(wind, 1),
             "tide": round(tide, 1),
         },
-        "metrics": {
-            "waveHeightFt": None if wave_height_ft is None else round(wave_height_ft, 2),
-            "dominantPeriodS": None if period_s is None else round(period_s, 1),
-            "waveDirectionDeg": None if wave_dir_deg is None else round(wave_dir_deg, 0),
-            "windSpeedMph": None if wind_speed_mph is None else round(wind_speed_mph, 1),
-            "windDirectionDeg": None if wind_dir_deg is None else round(wind_dir_deg, 0),
-            "tideHeightFt": None if tide_height_ft is None else round(tide_height_ft, 2),
-            "tideTrend": tide_trend,
-        },
         "sources": {
             "ndbcStation": loc.ndbc_station or None,
             "tideStation": loc.tide_station or None,
+            "wind": wind_source,
         },
         "timestamps": {
-            "generatedAt": now.isoformat(),
+            "generatedAt": now,
             "ndbcObservedAt": obs_time,
         },
         "notes": loc.notes or None,
     }
+    # Nested copy of the flattened readings for non-Mapbox consumers; shares the rounded values above.
+    props["metrics"] = {k: props[k] for k in METRIC_KEYS}
+    if wind_source == "open-meteo":
+        props["timestamps"]["openMeteoWindObservedAt"] = wind_observed_at
 
     return {
         "type": "Feature",
@@ -471,30 +566,97 @@ def build_feature(
     }
 
 
+async def fetch_all(
+    locations: List[LocationRow],
+    ndbc_station_ids: List[str],
+    tide_station_ids: List[str],
+    begin: datetime,
+    end: datetime,
+    ndbc_cache_dir: Optional[str] = None,
+) -> Tuple[Any, List[Any], List[Any]]:
+    """
+    Run every upstream request concurrently over one pooled HTTP/2 client, so each host
+    pays the TCP+TLS handshake once and multiplexes the rest over the same connection.
+    Results keep the (value, error) shape of the individual fetchers; an unexpected
+    exception is returned in place of its result rather than cancelling the others.
+    """
+    async with httpx.AsyncClient(
+        http2=True,
+        follow_redirects=True,
+        headers={"User-Agent": APP_ID},
+        timeout=20,
+        limits=httpx.Limits(max_keepalive_connections=32),
+    ) as client:
+        # HTTP/2 multiplexes same-host requests over one socket, so a connection limit would not
+        # cap concurrency; a semaphore does.
+        sem = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+        async def bounded(coro: Awaitable[Any]) -> Any:
+            async with sem:
+                return await coro
+
+        results = await asyncio.gather(
+            fetch_open_meteo_wind_current(client, locations),
+            *[bounded(fetch_ndbc_station_latest(client, sid, ndbc_cache_dir)) for sid in ndbc_station_ids],
+            *[bounded(fetch_coops_predictions_series(client, tsid, begin, end)) for tsid in tide_station_ids],
+            return_exceptions=True,
+        )
+    n_ndbc = len(ndbc_station_ids)
+    return results[0], results[1 : 1 + n_ndbc], results[1 + n_ndbc :]
+
+
 def ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
 
+def write_json_atomic(path: str, obj: Any, option: int = 0) -> None:
+    """
+    Serialize with orjson (aware datetimes become ISO 8601 strings) and swap the file into
+    place with os.replace, so readers never see a half-written file.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(orjson.dumps(obj, option=option))
+    os.replace(tmp_path, path)
+
+
 def main() -> int:
     repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
     locations_path = os.path.join(repo_root, "data", "locations.csv")
     # Site output folder used by the GitHub Pages deploy workflow.
     out_dir = os.path.join(repo_root, "site", "data")
     ensure_dir(out_dir)
+    # Opt-in conditional-GET cache for local reruns within the hour (e.g. NDBC_CACHE_DIR=.cache/ndbc).
+    # CI leaves it unset: each hourly run starts clean and NDBC has new data by then anyway.
+    ndbc_cache_dir = os.environ.get("NDBC_CACHE_DIR") or None
+    if ndbc_cache_dir:
+        ensure_dir(ndbc_cache_dir)
 
     now = utc_now()
     locations = read_locations_csv(locations_path)
 
-    # Per-location wind (Open-Meteo). Used to reduce identical wind across many beaches sharing a buoy.
-    open_meteo_wind, open_meteo_err = fetch_open_meteo_wind_current(locations)
-
     ndbc_station_ids = sorted({l.ndbc_station for l in locations if l.ndbc_station})
     tide_station_ids = sorted({l.tide_station for l in locations if l.tide_station})
+    begin = now - timedelta(hours=6)
+    end = now + timedelta(hours=6)
+
+    open_meteo_result, ndbc_results, coops_results = asyncio.run(
+        fetch_all(locations, ndbc_station_ids, tide_station_ids, begin, end, ndbc_cache_dir)
+    )
+
+    # Per-location wind (Open-Meteo). Used to reduce identical wind across many beaches sharing a buoy.
+    if isinstance(open_meteo_result, BaseException):
+        open_meteo_wind, open_meteo_err = {}, f"open_meteo_error:{type(open_meteo_result).__name__}:{open_meteo_result}"
+    else:
+        open_meteo_wind, open_meteo_err = open_meteo_result
 
     ndbc_data: Dict[str, Dict[str, Any]] = {}
     ndbc_errors: Dict[str, str] = {}
-    for sid in ndbc_station_ids:
-        parsed, err = fetch_ndbc_station_latest(sid)
+    for sid, res in zip(ndbc_station_ids, ndbc_results):
+        if isinstance(res, BaseException):
+            parsed, err = None, f"ndbc_error:{type(res).__name__}:{res}"
+        else:
+            parsed, err = res
         if parsed:
             ndbc_data[sid] = parsed
         else:
@@ -502,10 +664,11 @@ def main() -> int:
 
     tide_data: Dict[str, Tuple[Optional[float], Optional[str], Optional[str]]] = {}
     tide_errors: Dict[str, str] = {}
-    begin = now - timedelta(hours=6)
-    end = now + timedelta(hours=6)
-    for tsid in tide_station_ids:
-        series, err = fetch_coops_predictions_series(tsid, begin, end)
+    for tsid, res in zip(tide_station_ids, coops_results):
+        if isinstance(res, BaseException):
+            series, err = None, f"coops_error:{type(res).__name__}:{res}"
+        else:
+            series, err = res
         if series:
             h, trend = tide_now_and_trend(series, now)
             tide_data[tsid] = (h, trend, None)
@@ -513,39 +676,48 @@ def main() -> int:
             tide_errors[tsid] = err or "unknown_error"
             tide_data[tsid] = (None, None, err or "unknown_error")
 
-    features: List[Dict[str, Any]] = []
-    for loc in locations:
-        ndbc = ndbc_data.get(loc.ndbc_station) if loc.ndbc_station else None
-        tide_height_ft, tide_trend, _ = tide_data.get(loc.tide_station, (None, None, None))
-        feat = build_feature(loc, now, ndbc, tide_height_ft, tide_trend)
+    # Convert each buoy once; beaches sharing a station share its (read-only) readings.
+    station_readings = {sid: ndbc_readings(parsed) for sid, parsed in ndbc_data.items()}
+    no_readings = ndbc_readings(None)
+    readings = [station_readings.get(loc.ndbc_station, no_readings) for loc in locations]
+    tides = [tide_data.get(loc.tide_station, (None, None, None)) for loc in locations]
 
-        # Override wind fields if Open-Meteo wind is available for this point.
+    # Resolve each point's wind once: Open-Meteo per point when available, else the buoy. Values are
+    # rounded as published so the score matches what the popup shows.
+    effective_wind: Dict[str, WindReading] = {}
+    for loc, r in zip(locations, readings):
         ow = open_meteo_wind.get(loc.id)
         if ow:
-            feat["properties"]["windSpeedMph"] = round(float(ow["windSpeedMph"]), 1)
-            feat["properties"]["windDirectionDeg"] = round(float(ow["windDirectionDeg"]), 0)
-            feat["properties"]["metrics"]["windSpeedMph"] = round(float(ow["windSpeedMph"]), 1)
-            feat["properties"]["metrics"]["windDirectionDeg"] = round(float(ow["windDirectionDeg"]), 0)
-            feat["properties"]["timestamps"]["openMeteoWindObservedAt"] = ow.get("observedAt")
-            feat["properties"]["sources"]["wind"] = "open-meteo"
-            feat["properties"]["windSource"] = "open-meteo"
+            ws, wd, source, observed_at = ow["windSpeedMph"], ow["windDirectionDeg"], "open-meteo", ow.get("observedAt")
         else:
-            feat["properties"]["sources"]["wind"] = "ndbc"
-            feat["properties"]["windSource"] = "ndbc"
-
-        # Recompute wind suitability + total score if wind changed.
-        ws = feat["properties"].get("windSpeedMph")
-        wd = feat["properties"].get("windDirectionDeg")
-        wind_suit = wind_suitability_score(loc.offshore_wind_dir_deg, wd if isinstance(wd, (int, float)) else None, ws if isinstance(ws, (int, float)) else None)
-        feat["properties"]["windSuitability"] = round(wind_suit, 3)
-        wind_component = 30.0 * wind_suit
-        feat["properties"]["windScore"] = round(wind_component, 1)
-        feat["properties"]["components"]["wind"] = round(wind_component, 1)
-        # Keep swell/tide from existing computed values
-        swell_component = float(feat["properties"]["components"]["swell"])
-        tide_component = float(feat["properties"]["components"]["tide"])
-        feat["properties"]["qualityScore"] = round(clamp(swell_component + wind_component + tide_component, 0.0, 100.0), 1)
+            ws, wd, source, observed_at = r["windSpeedMph"], r["windDirectionDeg"], "ndbc", None
+        effective_wind[loc.id] = (
+            None if ws is None else round(float(ws), 1),
+            None if wd is None else round(float(wd), 0),
+            source,
+            observed_at,
+        )
+
+    scores = score_locations(
+        offshore_dir_deg=as_column(loc.offshore_wind_dir_deg for loc in locations),
+        wind_dir_deg=as_column(effective_wind[loc.id][1] for loc in locations),
+        wind_speed_mph=as_column(effective_wind[loc.id][0] for loc in locations),
+        wave_height_ft=as_column(r["waveHeightFt"] for r in readings),
+        period_s=as_column(r["dominantPeriodS"] for r in readings),
+        tide_height_ft=as_column(h for h, _, _ in tides),
+    )
 
+    features: List[Dict[str, Any]] = []
+    for i, (loc, r, (tide_height_ft, tide_trend, _)) in enumerate(zip(locations, readings, tides)):
+        feat = build_feature(
+            loc,
+            now,
+            r,
+            tide_height_ft,
+            tide_trend,
+            {k: float(v[i]) for k, v in scores.items()},
+            wind_override=effective_wind.get(loc.id),
+        )
         features.append(feat)
 
     fc = {"type": "FeatureCollection", "features": features}
@@ -554,11 +726,10 @@ def main() -> int:
     summary_path = os.path.join(out_dir, "summary.json")
     history_path = os.path.join(out_dir, "history_72h.json")
 
-    with open(beaches_geojson_path, "w", encoding="utf-8") as f:
-        json.dump(fc, f, ensure_ascii=False, separators=(",", ":"))
+    write_json_atomic(beaches_geojson_path, fc)
 
     summary = {
-        "generatedAt": now.isoformat(),
+        "generatedAt": now,
         "sources": {
             "ndbc": {
                 "base": NDBC_REALTIME2_BASE,
@@ -578,42 +749,33 @@ def main() -> int:
             },
         },
     }
-    with open(summary_path, "w", encoding="utf-8") as f:
-        json.dump(summary, f, ensure_ascii=False, indent=2)
+    write_json_atomic(summary_path, summary, option=orjson.OPT_INDENT_2)
 
     # Maintain a rolling 72-hour history for lightweight charting.
-    history_cutoff = now - timedelta(hours=72)
+    # Entries are all written by this script as UTC isoformat strings, so they order lexicographically.
+    history_cutoff_iso = (now - timedelta(hours=72)).isoformat()
     history: List[Dict[str, Any]] = []
     if os.path.exists(history_path):
         try:
-            with open(history_path, "r", encoding="utf-8") as f:
-                history = json.load(f) or []
+            with open(history_path, "rb") as f:
+                history = orjson.loads(f.read()) or []
         except Exception:
             history = []
     else:
         # GH Actions starts from a clean checkout; pull the last published history.
         try:
-            resp = requests.get(HISTORY_URL, timeout=15, headers={"User-Agent": APP_ID})
-            if resp.ok:
-                history = resp.json() or []
+            resp = httpx.get(HISTORY_URL, timeout=15, headers={"User-Agent": APP_ID}, follow_redirects=True)
+            if resp.is_success:
+                history = orjson.loads(resp.content) or []
         except Exception:
             history = []
 
-    def parse_ts(ts: str) -> Optional[datetime]:
-        try:
-            parsed = datetime.fromisoformat(ts)
-            if parsed.tzinfo is None:
-                parsed = parsed.replace(tzinfo=timezone.utc)
-            return parsed
-        except Exception:
-            return None
-
     history = [
         entry
         for entry in history
         if isinstance(entry, dict)
         and isinstance(entry.get("generatedAt"), str)
-        and (parse_ts(entry["generatedAt"]) or history_cutoff) >= history_cutoff
+        and entry["generatedAt"] >= history_cutoff_iso
     ]
 
     history.append(
@@ -635,8 +797,7 @@ def main() -> int:
         }
     )
 
-    with open(history_path, "w", encoding="utf-8") as f:
-        json.dump(history, f, ensure_ascii=False, separators=(",", ":"))
+    write_json_atomic(history_path, history)
 
     print(f"Wrote {beaches_geojson_path}")
     print(f"Wrote {summary_path}")